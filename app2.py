@@ -1,39 +1,412 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, simpledialog
 import threading
-from datetime import datetime
+import asyncio
+import contextlib
+import functools
+import time
+from datetime import datetime, timedelta
 import webbrowser
-import requests
-from bs4 import BeautifulSoup
-import google.generativeai as genai
 import json
 import os
 import re
+import sqlite3
 from urllib.parse import urlparse
 
 # Import your existing functions (assuming config.py exists)
 try:
     from config import GEMINI_API_KEY, NEWS_API_KEY
-    genai.configure(api_key=GEMINI_API_KEY)
-    model = genai.GenerativeModel('gemini-1.5-flash')
 except ImportError:
     messagebox.showerror("Configuration Error", "Please ensure config.py exists with GEMINI_API_KEY and NEWS_API_KEY")
     GEMINI_API_KEY = None
     NEWS_API_KEY = None
 
 # Constants
-MEMORY_FILE = "networking_memory.json"
+CONTACTS_DB = "contacts.db"
+LEGACY_MEMORY_FILE = "networking_memory.json"  # Imported into CONTACTS_DB on first run
+CLI_MEMORY_FILE = "networking_memory.jsonl"  # The CLI's store; preferred over the legacy file
+LEGACY_IMPORTED_VERSION = 1  # PRAGMA user_version once the one-time import has run
+CONTACT_COLUMNS = ('name', 'company', 'role', 'linkedin', 'website', 'industry',
+                   'summary', 'news_links', 'created_date')
+INSERT_CONTACT_SQL = (f"INSERT INTO contacts ({', '.join(CONTACT_COLUMNS)}) "
+                      f"VALUES ({', '.join('?' * len(CONTACT_COLUMNS))})")
+SEARCH_FIELDS = ('name', 'company', 'role', 'industry')
+SEARCH_DEBOUNCE_MS = 150
 MAX_CONTENT_LENGTH = 5000
+MAX_RESPONSE_BYTES = 256 * 1024  # Plenty of HTML to yield MAX_CONTENT_LENGTH of text
+MAX_PROMPT_CONTENT_LENGTH = 3000
+MIN_PROMPT_LINE_LENGTH = 20  # Shorter lines are mostly navigation and menu labels
 REQUEST_TIMEOUT = 10
+HTTP_RETRIES = 2  # Extra attempts after a connection error, timeout or RETRY_STATUSES reply
+HTTP_RETRY_BACKOFF = 0.3  # Seconds before the first retry, doubling after that
+RETRY_STATUSES = frozenset({502, 503, 504})
+NEWS_API_URL = "https://newsapi.org/v2/everything"
+NEWS_API_PARAMS = {"language": "en", "sortBy": "publishedAt"}
+GEMINI_MODEL_NAME = 'gemini-1.5-flash'
+NEWS_QUERY_LIMIT = 500  # NewsAPI's maximum length for the q parameter
+NEWS_BATCH_SIZE = 5
+NEWS_BATCH_WAIT_MS = 200
+NEWS_CACHE_TTL = timedelta(hours=24)
+WEBSITE_CACHE_TTL = timedelta(days=7)
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Heavy research libraries, filled in by load_research_modules() once the window is up
+aiohttp = etree = lxml_html = genai = None
+CONTENT_XPATH = None  # Every element scrape_website reads, in one document-order pass
+model = None  # Gemini model, created on the first generate_summary call
+research_modules_lock = threading.RLock()
+
+def load_research_modules():
+    """Import the HTTP, HTML and Gemini libraries the first time they are needed."""
+    global aiohttp, etree, lxml_html, genai, CONTENT_XPATH
+    with research_modules_lock:
+        if genai is not None:
+            return
+        
+        import aiohttp as aiohttp_module
+        from lxml import etree as etree_module, html as lxml_html_module
+        import google.generativeai as genai_module
+        
+        aiohttp = aiohttp_module
+        etree, lxml_html = etree_module, lxml_html_module
+        CONTENT_XPATH = etree.XPath('//h1 | //h2 | //h3 | //p | //main | //article | //section')
+        genai = genai_module  # Set last; it marks the load as complete
+
+PROMPT_TEMPLATE = """
+You are a networking assistant. Analyze the following information about {name} from {company} and create a concise networking brief.
+
+Focus on:
+1. Key information about the person and their role
+2. Company overview and recent developments
+3. Industry trends and opportunities
+4. Potential conversation starters
+5. Ways to add value to this connection
+
+Content to analyze:
+{content}
+
+Please provide a structured summary that will help prepare for a networking conversation.
+""".strip()
+NO_SUMMARY_MESSAGE = "No content available for summary or API key missing."
+NO_SOURCES_MESSAGE = "No research sources provided."
+WEBSITE_SECTION_HEADER = "Company Website Content:"
+NEWS_SECTION_HEADER = "Recent Industry News:"
+SUMMARY_FAILED_TEMPLATE = ("Summary generation failed: {error}. Manual notes: Company website and news "
+                           "content were collected for {name} at {company}.")
+
+class _NewsBatcher:
+    """Coalesce NewsAPI queries that arrive close together into one request.
+    
+    Runs entirely on the research event loop, so no locking is needed.
+    """
+    
+    def __init__(self, fetch, max_batch=NEWS_BATCH_SIZE, max_wait_ms=NEWS_BATCH_WAIT_MS):
+        self.fetch = fetch
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.pending = []
+        self.flush_handle = None
+        self.dispatch_tasks = set()
+        self.futures = {}  # (api_key, query, num_articles) -> future, while queued or in flight
+        
+    async def submit(self, api_key: str, query: str, num_articles: int) -> list:
+        """Queue a query and wait for its share of the batched articles."""
+        # An identical query already queued or in flight shares that request
+        key = (api_key, query, num_articles)
+        future = self.futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self.futures[key] = future
+            future.add_done_callback(lambda _, key=key: self.futures.pop(key, None))
+            self.pending.append((api_key, query, num_articles, future))
+            
+            # Nothing to coalesce with, so don't make a lone lookup wait; otherwise
+            # flush when the batch is full or max_wait after its first query
+            if len(self.pending) == 1 and not self.dispatch_tasks:
+                self.flush()
+            elif len(self.pending) >= self.max_batch:
+                self.flush()
+            elif self.flush_handle is None:
+                self.flush_handle = loop.call_later(self.max_wait, self.flush)
+        # Shield so one caller giving up doesn't cancel the others' request
+        return await asyncio.shield(future)
+        
+    def flush(self):
+        """Dispatch everything queued so far as one batch."""
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        batch, self.pending = self.pending, []
+        if batch:
+            task = asyncio.ensure_future(self.run_batch(batch))
+            self.dispatch_tasks.add(task)
+            task.add_done_callback(self.dispatch_tasks.discard)
+            
+    async def run_batch(self, batch):
+        """Dispatch a batch, failing any queries it left unanswered."""
+        try:
+            await self.dispatch(batch)
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+                        
+    async def dispatch(self, batch):
+        """Answer a batch with one combined query, falling back to one call each."""
+        api_keys = {api_key for api_key, *_ in batch}
+        queries = list(dict.fromkeys(query for _, query, _, _ in batch))
+        combined_query = ' OR '.join(f"({query})" for query in queries)
+        
+        if len(queries) == 1 or len(api_keys) > 1 or len(combined_query) > NEWS_QUERY_LIMIT:
+            await self.fetch_each(batch)
+            return
+        
+        page_size = min(sum(num_articles for _, _, num_articles, _ in batch), 100)
+        articles = await self.fetch(batch[0][0], combined_query, page_size)
+        article_texts = [
+            f"{article.get('title') or ''} {article.get('description') or ''}".lower()
+            for article in articles
+        ]
+        
+        # Hand each query the articles that mention one of its keywords as a
+        # whole word, so "AI" doesn't claim every article that says "said"
+        unmatched = []
+        for item in batch:
+            _, query, num_articles, future = item
+            keywords = [word for word in re.findall(r"\w+", query.lower())
+                        if word not in ('and', 'or', 'not')]
+            if not keywords:
+                unmatched.append(item)
+                continue
+            pattern = re.compile(r"\b(?:" + "|".join(map(re.escape, keywords)) + r")\b")
+            matched = [article for article, text in zip(articles, article_texts)
+                       if pattern.search(text)][:num_articles]
+            if matched:
+                future.set_result(matched)
+            else:
+                unmatched.append(item)
+        
+        await self.fetch_each(unmatched)
+        
+    async def fetch_each(self, batch):
+        """Issue one request per queued query, all at once."""
+        results = await asyncio.gather(
+            *(self.fetch(api_key, query, num_articles) for api_key, query, num_articles, _ in batch),
+            return_exceptions=True
+        )
+        for (*_, future), result in zip(batch, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
 
 class NetworkingAssistantGUI:
     def __init__(self, root):
         self.root = root
+        self.http = None
+        self.news_batcher = _NewsBatcher(self.request_news)
+        
+        # All research runs as coroutines on one long-lived background loop
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        
+        self.db_lock = threading.Lock()
+        self.db = self.open_database()
         self.setup_main_window()
         self.create_widgets()
         self.current_contacts = []
+        self.contacts_by_id = {}
         self.load_contacts()
         
+        # Let the window paint before paying for the heavy imports
+        self.root.after_idle(self.load_research_support)
+        
+    def load_research_support(self):
+        """Import research libraries and open the HTTP session if not done yet."""
+        with research_modules_lock:
+            load_research_modules()
+            if self.http is None:
+                self.http = asyncio.run_coroutine_threadsafe(
+                    self.create_http_session(), self.loop
+                ).result()
+        
+    async def create_http_session(self):
+        """Create a keep-alive session shared by website and news requests."""
+        # Created on the research loop, which owns the session's connections
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=50),
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            headers={'User-Agent': USER_AGENT}
+        )
+        
+    @contextlib.asynccontextmanager
+    async def http_get(self, url: str, **kwargs):
+        """GET through the shared session, retrying transient failures with backoff."""
+        for attempt in range(HTTP_RETRIES + 1):
+            try:
+                response = await self.http.get(url, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == HTTP_RETRIES:
+                    raise
+            else:
+                if response.status not in RETRY_STATUSES or attempt == HTTP_RETRIES:
+                    break
+                response.release()
+            await asyncio.sleep(HTTP_RETRY_BACKOFF * 2 ** attempt)
+        
+        async with response:
+            yield response
+        
+    def shutdown_research(self):
+        """Close the HTTP session and stop the research loop without waiting on it.
+        
+        The loop thread may be inside a root.after() call that needs the Tk
+        thread, so blocking here until it finishes could deadlock.
+        """
+        async def close_and_stop():
+            try:
+                # Cancel in-flight research so it stops touching the window
+                current = asyncio.current_task()
+                for task in asyncio.all_tasks():
+                    if task is not current:
+                        task.cancel()
+                if self.http is not None:
+                    await self.http.close()
+            finally:
+                self.loop.stop()
+        
+        asyncio.run_coroutine_threadsafe(close_and_stop(), self.loop)
+        
+    def open_database(self):
+        """Open the contacts database, creating the schema on first use."""
+        db = sqlite3.connect(CONTACTS_DB, check_same_thread=False)
+        db.row_factory = sqlite3.Row
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        with db:
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS contacts (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT, company TEXT, role TEXT, linkedin TEXT,
+                    website TEXT, industry TEXT, summary TEXT,
+                    news_links TEXT, created_date TEXT
+                )
+            """)
+            db.execute("CREATE INDEX IF NOT EXISTS idx_name_company ON contacts(name, company)")
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS research_cache (
+                    kind TEXT, key TEXT, fetched_at REAL, payload TEXT,
+                    PRIMARY KEY (kind, key)
+                )
+            """)
+        self.import_legacy_contacts(db)
+        return db
+        
+    def import_legacy_contacts(self, db):
+        """Copy contacts from the CLI's memory file into a new database, once.
+        
+        The CLI's JSONL file already holds everything migrated from the legacy
+        JSON file, so it wins when both exist. The import is recorded in
+        PRAGMA user_version so deleting every contact doesn't bring them back.
+        """
+        if db.execute("PRAGMA user_version").fetchone()[0] >= LEGACY_IMPORTED_VERSION:
+            return
+        # Databases from before the marker existed already ran their import
+        if db.execute("SELECT 1 FROM contacts LIMIT 1").fetchone():
+            self.mark_legacy_imported(db)
+            return
+        
+        try:
+            if os.path.exists(CLI_MEMORY_FILE):
+                legacy_contacts = []
+                with open(CLI_MEMORY_FILE, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            legacy_contacts.append(json.loads(line))
+                        except json.JSONDecodeError:
+                            continue  # Blank or half-written line
+            elif os.path.exists(LEGACY_MEMORY_FILE):
+                with open(LEGACY_MEMORY_FILE, 'r', encoding='utf-8') as f:
+                    legacy_contacts = json.load(f)
+            else:
+                legacy_contacts = []
+        except (json.JSONDecodeError, UnicodeDecodeError, IOError):
+            return  # Try again next launch
+        if not isinstance(legacy_contacts, list):
+            legacy_contacts = []
+        
+        rows = [self.contact_to_row(contact) for contact in legacy_contacts if isinstance(contact, dict)]
+        try:
+            with db:
+                db.executemany(INSERT_CONTACT_SQL, rows)
+                self.mark_legacy_imported(db)
+        except sqlite3.Error as e:
+            # Never let a bad legacy record keep the app from starting
+            messagebox.showwarning("Import Warning", f"Could not import legacy contacts: {str(e)}")
+            
+    def mark_legacy_imported(self, db):
+        """Record in the database that the legacy import has run."""
+        # PRAGMA can't take parameters; the value is a trusted int constant.
+        # Inside import_legacy_contacts' transaction it commits with the rows
+        db.execute(f"PRAGMA user_version = {LEGACY_IMPORTED_VERSION}")
+        
+    def contact_to_row(self, contact):
+        """Convert a contact dict into a tuple matching CONTACT_COLUMNS."""
+        return tuple(self.column_value(column, contact.get(column)) for column in CONTACT_COLUMNS)
+        
+    def column_value(self, column, value):
+        """Coerce one contact field into something SQLite can store as TEXT."""
+        if column == 'news_links':
+            links = value if isinstance(value, list) else []
+            return json.dumps([str(link) for link in links if link], ensure_ascii=False)
+        if value is None:
+            return ''
+        if isinstance(value, str):
+            return value
+        # Hand-edited or foreign records may hold numbers, lists or dicts
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, ensure_ascii=False)
+        return str(value)
+        
+    def row_to_contact(self, row):
+        """Convert a database row into a contact dict."""
+        contact = dict(row)
+        contact['news_links'] = json.loads(contact['news_links'] or '[]')
+        # Lowercased once here so filtering is a plain substring test
+        contact['_search'] = ' '.join(contact.get(field) or '' for field in SEARCH_FIELDS).lower()
+        contact['_date_str'] = self.format_created_date(contact.get('created_date') or '')
+        return contact
+        
+    def format_created_date(self, date_str):
+        """Format a stored ISO timestamp as YYYY-MM-DD for the contacts list."""
+        if not date_str:
+            return 'Unknown'
+        try:
+            date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            return date_obj.strftime('%Y-%m-%d')
+        except:
+            return date_str[:10] if len(date_str) >= 10 else date_str
+        
+    def read_cache(self, kind, key, ttl):
+        """Return a cached research result, or None if missing or expired."""
+        with self.db_lock:
+            row = self.db.execute(
+                "SELECT fetched_at, payload FROM research_cache WHERE kind = ? AND key = ?",
+                (kind, key)
+            ).fetchone()
+        if row is None or time.time() - row['fetched_at'] > ttl.total_seconds():
+            return None
+        return json.loads(row['payload'])
+        
+    def write_cache(self, kind, key, value):
+        """Store a research result for later read_cache calls."""
+        with self.db_lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO research_cache (kind, key, fetched_at, payload) VALUES (?, ?, ?, ?)",
+                (kind, key, time.time(), json.dumps(value, ensure_ascii=False))
+            )
+        
     def setup_main_window(self):
         """Configure the main window with modern styling."""
         self.root.title("🔗 Networking Assistant Pro")
@@ -129,7 +502,8 @@ class NetworkingAssistantGUI:
                 font=('Segoe UI', 10)).pack(side='left', padx=(0, 5))
         
         self.search_var = tk.StringVar()
-        self.search_var.trace('w', self.filter_contacts)
+        self.search_after_id = None
+        self.search_var.trace('w', self.schedule_filter)
         search_entry = tk.Entry(search_frame, textvariable=self.search_var,
                                bg='#404040', fg='#ffffff', width=20,
                                font=('Segoe UI', 10))
@@ -271,13 +645,12 @@ Add a new contact to see the research in action!
         self.research_text.configure(state='disabled')
         
     def load_contacts(self):
-        """Load contacts from memory file and populate the tree."""
+        """Load contacts from the database and populate the tree."""
         try:
-            if os.path.exists(MEMORY_FILE):
-                with open(MEMORY_FILE, 'r', encoding='utf-8') as f:
-                    self.current_contacts = json.load(f)
-            else:
-                self.current_contacts = []
+            with self.db_lock:
+                rows = self.db.execute("SELECT * FROM contacts ORDER BY id").fetchall()
+            self.current_contacts = [self.row_to_contact(row) for row in rows]
+            self.contacts_by_id = {contact['id']: contact for contact in self.current_contacts}
             
             self.populate_contacts_tree()
             self.status_var.set(f"Loaded {len(self.current_contacts)} contacts")
@@ -288,53 +661,45 @@ Add a new contact to see the research in action!
             
     def populate_contacts_tree(self, contacts=None):
         """Populate the contacts tree with data."""
-        # Clear existing items
-        for item in self.contacts_tree.get_children():
-            self.contacts_tree.delete(item)
+        # Clear existing items in a single Tcl call
+        self.contacts_tree.delete(*self.contacts_tree.get_children())
         
         contacts_to_show = contacts if contacts is not None else self.current_contacts
         
+        # Build every row in Python first so the insert loop only crosses into Tcl
+        rows = []
         for contact in contacts_to_show:
-            # Format date
-            date_str = contact.get('created_date', '')
-            if date_str:
-                try:
-                    date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                    formatted_date = date_obj.strftime('%Y-%m-%d')
-                except:
-                    formatted_date = date_str[:10] if len(date_str) >= 10 else date_str
-            else:
-                formatted_date = 'Unknown'
-            
             values = (
                 contact.get('name', ''),
                 contact.get('company', ''),
                 contact.get('role', ''),
                 contact.get('industry', ''),
-                formatted_date
+                contact['_date_str']
             )
+            rows.append((str(contact['id']), values))
+        
+        # The row iid is the contact's database id, used for lookups
+        insert = self.contacts_tree.insert
+        for iid, values in rows:
+            insert('', 'end', iid=iid, values=values)
             
-            self.contacts_tree.insert('', 'end', values=values, tags=(contact,))
-            
+    def schedule_filter(self, *args):
+        """Debounce search keystrokes so fast typing filters only once."""
+        if self.search_after_id is not None:
+            self.root.after_cancel(self.search_after_id)
+        self.search_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self.filter_contacts)
+        
     def filter_contacts(self, *args):
         """Filter contacts based on search term."""
+        self.search_after_id = None
         search_term = self.search_var.get().lower()
         
         if not search_term:
             self.populate_contacts_tree()
             return
         
-        filtered_contacts = []
-        for contact in self.current_contacts:
-            searchable_text = ' '.join([
-                contact.get('name', '').lower(),
-                contact.get('company', '').lower(),
-                contact.get('role', '').lower(),
-                contact.get('industry', '').lower()
-            ])
-            
-            if search_term in searchable_text:
-                filtered_contacts.append(contact)
+        filtered_contacts = [contact for contact in self.current_contacts
+                             if search_term in contact['_search']]
         
         self.populate_contacts_tree(filtered_contacts)
         
@@ -344,18 +709,8 @@ Add a new contact to see the research in action!
         if not selection:
             return
         
-        item = self.contacts_tree.item(selection[0])
-        contact_index = None
-        
-        # Find the contact in our list
-        for i, contact in enumerate(self.current_contacts):
-            if (contact.get('name') == item['values'][0] and 
-                contact.get('company') == item['values'][1]):
-                contact_index = i
-                break
-        
-        if contact_index is not None:
-            contact = self.current_contacts[contact_index]
+        contact = self.contacts_by_id.get(int(selection[0]))
+        if contact is not None:
             self.display_contact_details(contact)
             
     def display_contact_details(self, contact):
@@ -388,24 +743,21 @@ Add a new contact to see the research in action!
             messagebox.showwarning("Warning", "Please select a contact to delete.")
             return
         
-        item = self.contacts_tree.item(selection[0])
-        contact_name = item['values'][0]
-        company_name = item['values'][1]
+        contact = self.contacts_by_id.get(int(selection[0]))
+        if contact is None:
+            return
+        contact_name = contact.get('name')
+        company_name = contact.get('company')
         
         if messagebox.askyesno("Confirm Delete", 
                               f"Are you sure you want to delete {contact_name} from {company_name}?"):
             
-            # Find and remove the contact
-            for i, contact in enumerate(self.current_contacts):
-                if (contact.get('name') == contact_name and 
-                    contact.get('company') == company_name):
-                    self.current_contacts.pop(i)
-                    break
-            
-            # Save updated list
+            # Remove it from the database, then from the in-memory list
             try:
-                with open(MEMORY_FILE, 'w', encoding='utf-8') as f:
-                    json.dump(self.current_contacts, f, indent=2, ensure_ascii=False)
+                with self.db_lock, self.db:
+                    self.db.execute("DELETE FROM contacts WHERE id = ?", (contact['id'],))
+                self.current_contacts.remove(contact)
+                del self.contacts_by_id[contact['id']]
                 
                 self.populate_contacts_tree()
                 self.details_text.delete('1.0', 'end')
@@ -421,7 +773,7 @@ Add a new contact to see the research in action!
         self.status_var.set("Form cleared")
         
     def add_contact_async(self):
-        """Add contact in a separate thread to prevent UI freezing."""
+        """Add contact on the research loop to prevent UI freezing."""
         # Validate required fields
         name = self.form_vars['name'].get().strip()
         company = self.form_vars['company'].get().strip()
@@ -434,61 +786,37 @@ Add a new contact to see the research in action!
         self.status_var.set("🔍 Researching contact... Please wait...")
         self.notebook.select(2)  # Switch to research tab
         
-        thread = threading.Thread(target=self.process_new_contact)
-        thread.daemon = True
-        thread.start()
+        # Read the form here on the Tk thread; the coroutine must not touch widgets
+        contact_info = {key: var.get().strip() for key, var in self.form_vars.items()}
         
-    def process_new_contact(self):
-        """Process new contact research (runs in background thread)."""
         try:
-            # Get form data
-            contact_info = {key: var.get().strip() for key, var in self.form_vars.items()}
-            
-            # Update research display
-            self.root.after(0, lambda: self.update_research_display("🚀 Starting research...\n\n"))
-            
-            # Collect content for analysis
-            all_content = []
-            news_links = []
-            
-            # Scrape website if provided
-            if contact_info['website']:
-                try:
-                    self.root.after(0, lambda: self.update_research_display("🌐 Analyzing company website...\n"))
-                    website_content = self.scrape_website(contact_info['website'])
-                    if website_content:
-                        all_content.append(f"Company Website Content:\n{website_content}")
-                        self.root.after(0, lambda: self.update_research_display("✅ Website analysis complete\n\n"))
-                except Exception as e:
-                    self.root.after(0, lambda: self.update_research_display(f"⚠️ Website scraping failed: {str(e)}\n\n"))
-            
-            # Fetch news if industry provided
-            if contact_info['industry']:
-                try:
-                    self.root.after(0, lambda: self.update_research_display("📰 Fetching industry news...\n"))
-                    news_articles = self.fetch_news(NEWS_API_KEY, contact_info['industry'])
-                    if news_articles:
-                        news_content = []
-                        for article in news_articles:
-                            title = article.get('title', '')
-                            description = article.get('description', '')
-                            url = article.get('url', '')
-                            
-                            if title or description:
-                                news_content.append(f"• {title}: {description}")
-                                if url:
-                                    news_links.append(url)
-                        
-                        if news_content:
-                            all_content.append(f"Recent Industry News:\n" + "\n".join(news_content))
-                            self.root.after(0, lambda: self.update_research_display(f"✅ Found {len(news_articles)} news articles\n\n"))
-                except Exception as e:
-                    self.root.after(0, lambda: self.update_research_display(f"⚠️ News fetching failed: {str(e)}\n\n"))
-            
-            # Generate AI summary
-            self.root.after(0, lambda: self.update_research_display("🤖 Generating AI networking brief...\n"))
-            combined_content = "\n\n".join(all_content) if all_content else ""
-            summary = self.generate_summary(combined_content, contact_info)
+            self.load_research_support()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load research libraries: {str(e)}")
+            return
+        
+        asyncio.run_coroutine_threadsafe(self.process_new_contact(contact_info), self.loop)
+        
+    async def process_new_contact(self, contact_info):
+        """Process new contact research (runs on the research loop)."""
+        try:
+            # Nothing to research: skip the network and Gemini entirely
+            if not contact_info['website'] and not contact_info['industry']:
+                news_links = []
+                summary = NO_SOURCES_MESSAGE
+            else:
+                self.root.after(0, lambda: self.update_research_display("🚀 Starting research...\n\n"))
+                combined_content, news_links = await self.gather_research(contact_info)
+                
+                if combined_content:
+                    self.root.after(0, lambda: self.update_research_display("🤖 Generating AI networking brief...\n\n"))
+                    # The Gemini client is blocking, so it runs in the default executor
+                    summary = await self.loop.run_in_executor(None, functools.partial(
+                        self.generate_summary, combined_content, contact_info,
+                        on_chunk=lambda text: self.root.after(0, self.update_research_display, text)
+                    ))
+                else:
+                    summary = NO_SUMMARY_MESSAGE
             
             # Display results
             results = f"""
@@ -503,15 +831,83 @@ Add a new contact to see the research in action!
                 for i, link in enumerate(news_links[:5], 1):
                     results += f"  {i}. {link}\n"
             
-            self.root.after(0, lambda: self.show_final_results(results))
-            
-            # Save to memory
+            # Save before showing results so the reload picks up the new contact
             self.save_contact_to_memory(contact_info, summary, news_links)
             
+            self.root.after(0, lambda: self.show_final_results(results))
+            
         except Exception as e:
             error_msg = f"❌ Error processing contact: {str(e)}"
             self.root.after(0, lambda: self.update_research_display(error_msg))
             
+    async def gather_research(self, contact_info):
+        """Scrape the website and fetch news, returning (prompt content, news links)."""
+        # Collect content for analysis
+        all_content = []
+        news_links = []
+        
+        # Scrape the website and fetch news concurrently; both are network-bound
+        website_future = None
+        news_future = None
+        
+        if contact_info['website']:
+            self.root.after(0, lambda: self.update_research_display("🌐 Analyzing company website...\n"))
+            website_future = asyncio.ensure_future(self.scrape_website(contact_info['website']))
+            website_future.add_done_callback(self.report_website_result)
+        
+        if contact_info['industry']:
+            self.root.after(0, lambda: self.update_research_display("📰 Fetching industry news...\n"))
+            news_future = asyncio.ensure_future(self.fetch_news(NEWS_API_KEY, contact_info['industry']))
+            news_future.add_done_callback(self.report_news_result)
+        
+        pending = [future for future in (website_future, news_future) if future is not None]
+        await asyncio.gather(*pending, return_exceptions=True)
+        
+        # Failures were already reported by the done callbacks
+        if website_future is not None and website_future.exception() is None:
+            website_content = website_future.result()
+            if website_content:
+                all_content.append(f"{WEBSITE_SECTION_HEADER}\n{website_content}")
+        
+        if news_future is not None and news_future.exception() is None:
+            news_content = []
+            for article in news_future.result():
+                title = article.get('title', '')
+                description = article.get('description', '')
+                url = article.get('url', '')
+                
+                if title or description:
+                    news_content.append(f"• {title}: {description}")
+                    if url:
+                        news_links.append(url)
+            
+            if news_content:
+                all_content.append(f"{NEWS_SECTION_HEADER}\n" + "\n".join(news_content))
+        
+        return "\n\n".join(all_content), news_links
+        
+    def report_website_result(self, future):
+        """Report website scraping progress once its future completes."""
+        error = future.exception()
+        if error is not None:
+            message = f"⚠️ Website scraping failed: {str(error)}\n\n"
+        elif future.result():
+            message = "✅ Website analysis complete\n\n"
+        else:
+            return
+        self.root.after(0, lambda: self.update_research_display(message))
+        
+    def report_news_result(self, future):
+        """Report news fetching progress once its future completes."""
+        error = future.exception()
+        if error is not None:
+            message = f"⚠️ News fetching failed: {str(error)}\n\n"
+        elif future.result():
+            message = f"✅ Found {len(future.result())} news articles\n\n"
+        else:
+            return
+        self.root.after(0, lambda: self.update_research_display(message))
+            
     def update_research_display(self, text):
         """Update the research display (called from main thread)."""
         self.research_text.configure(state='normal')
@@ -535,7 +931,7 @@ Add a new contact to see the research in action!
         self.load_contacts()
         
     def save_contact_to_memory(self, contact_info, summary, news_links):
-        """Save contact to memory file."""
+        """Insert a single contact row into the database."""
         new_entry = {
             "name": contact_info['name'],
             "role": contact_info['role'],
@@ -549,11 +945,11 @@ Add a new contact to see the research in action!
         }
         
         try:
-            self.current_contacts.append(new_entry)
-            with open(MEMORY_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.current_contacts, f, indent=2, ensure_ascii=False)
+            with self.db_lock, self.db:
+                self.db.execute(INSERT_CONTACT_SQL, self.contact_to_row(new_entry))
         except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Save Error", f"Failed to save contact: {str(e)}"))
+            error_msg = f"Failed to save contact: {str(e)}"
+            self.root.after(0, lambda: messagebox.showerror("Save Error", error_msg))
     
     # Your existing utility functions (adapted for the class)
     def is_valid_url(self, url: str) -> bool:
@@ -564,72 +960,105 @@ Add a new contact to see the research in action!
         except Exception:
             return False
 
-    def scrape_website(self, url: str) -> str:
+    async def scrape_website(self, url: str) -> str:
         """Scrape website content with improved extraction and error handling."""
         if not self.is_valid_url(url):
             raise ValueError("Invalid URL provided")
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        cached = self.read_cache('website', url, WEBSITE_CACHE_TTL)
+        if cached is not None:
+            return cached
         
         try:
-            response = requests.get(url, timeout=REQUEST_TIMEOUT, headers=headers)
-            response.raise_for_status()
-        except requests.exceptions.Timeout:
+            async with self.http_get(url) as response:
+                response.raise_for_status()
+                encoding = response.charset or 'utf-8'
+                
+                # Stop downloading once we have enough HTML to work with
+                chunks = []
+                total = 0
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    chunks.append(chunk)
+                    total += len(chunk)
+                    if total >= MAX_RESPONSE_BYTES:
+                        break
+        except asyncio.TimeoutError:
             raise RuntimeError("Website request timed out")
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             raise RuntimeError(f"Error fetching website: {e}")
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Parsing is CPU-bound; keep it off the event loop
+        html = b"".join(chunks)[:MAX_RESPONSE_BYTES]
+        content = await self.loop.run_in_executor(None, self.extract_website_text, html, encoding)
         
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        # Extract content from multiple elements for better coverage
-        content_elements = []
+        if content:
+            self.write_cache('website', url, content)
+        return content
         
-        # Get headings for structure
-        headings = soup.find_all(['h1', 'h2', 'h3'])
-        content_elements.extend([h.get_text().strip() for h in headings if h.get_text().strip()])
+    def extract_website_text(self, html: bytes, encoding: str) -> str:
+        """Pull headings, paragraphs and main content text out of raw HTML."""
+        if not html.strip():
+            return ""
         
-        # Get paragraph content
-        paragraphs = soup.find_all('p')
-        content_elements.extend([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
+        try:
+            parser = lxml_html.HTMLParser(encoding=encoding)
+        except LookupError:
+            parser = lxml_html.HTMLParser(encoding='utf-8')
         
-        # Get main content areas
-        main_content = soup.find_all(['main', 'article', 'section'])
-        for element in main_content:
-            text = element.get_text().strip()
-            if text and len(text) > 50:  # Only substantial content
-                content_elements.append(text)
+        try:
+            tree = lxml_html.document_fromstring(html, parser=parser)
+        except etree.ParserError:
+            return ""
         
-        content = " ".join(content_elements)
+        # Remove script and style elements
+        etree.strip_elements(tree, 'script', 'style', with_tail=False)
+        
+        # Bucket the matched elements so headings still lead, then paragraphs,
+        # then the larger main content areas
+        headings = []
+        paragraphs = []
+        main_content = []
+        for element in CONTENT_XPATH(tree):
+            text = element.text_content().strip()
+            if not text:
+                continue
+            if element.tag == 'p':
+                paragraphs.append(text)
+            elif element.tag in ('main', 'article', 'section'):
+                if len(text) > 50:  # Only substantial content
+                    main_content.append(text)
+            else:
+                headings.append(text)
         
-        # Clean up whitespace
-        content = re.sub(r'\s+', ' ', content)
+        content_elements = headings + paragraphs + main_content
         
-        return content.strip()[:MAX_CONTENT_LENGTH]
+        # Join and collapse whitespace in one pass; str.split() runs in C
+        return " ".join(" ".join(content_elements).split())[:MAX_CONTENT_LENGTH]
 
-    def fetch_news(self, api_key: str, query: str, num_articles: int = 5) -> list:
-        """Fetch news articles from NewsAPI with improved error handling."""
+    async def fetch_news(self, api_key: str, query: str, num_articles: int = 5) -> list:
+        """Fetch news articles, batched with other queries made at the same time."""
         if not query.strip() or not api_key:
             return []
         
-        base_url = "https://newsapi.org/v2/everything"
-        params = {
-            "q": query.strip()[:500],
-            "apiKey": api_key,
-            "pageSize": num_articles,
-            "language": "en",
-            "sortBy": "publishedAt"
-        }
+        query = query.strip()[:NEWS_QUERY_LIMIT]
+        cache_key = f"{num_articles}:{query}"
+        cached = self.read_cache('news', cache_key, NEWS_CACHE_TTL)
+        if cached is not None:
+            return cached
+        
+        articles = await self.news_batcher.submit(api_key, query, num_articles)
+        if articles:  # An empty list usually means the request failed
+            self.write_cache('news', cache_key, articles)
+        return articles
+        
+    async def request_news(self, api_key: str, query: str, num_articles: int) -> list:
+        """Fetch news articles from NewsAPI with improved error handling."""
+        params = {**NEWS_API_PARAMS, "q": query, "apiKey": api_key, "pageSize": num_articles}
 
         try:
-            response = requests.get(base_url, params=params, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-            data = response.json()
+            async with self.http_get(NEWS_API_URL, params=params) as response:
+                response.raise_for_status()
+                data = await response.json()
             
             if data.get("status") != "ok":
                 return []
@@ -637,35 +1066,67 @@ Add a new contact to see the research in action!
             articles = data.get("articles", [])
             return articles if isinstance(articles, list) else []
             
-        except:
+        except Exception:
             return []
 
-    def generate_summary(self, content: str, contact_info: dict) -> str:
-        """Generate AI summary with improved prompting."""
-        if not content.strip() or not GEMINI_API_KEY:
-            return "No content available for summary or API key missing."
-        
-        prompt = f"""
-        You are a networking assistant. Analyze the following information about {contact_info['name']} from {contact_info['company']} and create a concise networking brief.
-
-        Focus on:
-        1. Key information about the person and their role
-        2. Company overview and recent developments
-        3. Industry trends and opportunities
-        4. Potential conversation starters
-        5. Ways to add value to this connection
-
-        Content to analyze:
-        {content}
-
-        Please provide a structured summary that will help prepare for a networking conversation.
+    def trim_prompt_content(self, content: str) -> str:
+        """Drop boilerplate and cap each research section before prompting Gemini."""
+        sections = []
+        for section in content.split("\n\n"):
+            lines = [" ".join(line.split()) for line in section.splitlines()]
+            section = "\n".join(line for line in lines if len(line) >= MIN_PROMPT_LINE_LENGTH)
+            section = ". ".join(dict.fromkeys(section.split(". ")))
+            if section:
+                sections.append(section)
+        
+        # Smallest sections first, so any budget they leave goes to the larger ones
+        budget = MAX_PROMPT_CONTENT_LENGTH
+        remaining = len(sections)
+        for index in sorted(range(len(sections)), key=lambda i: len(sections[i])):
+            sections[index] = sections[index][:budget // remaining]
+            budget -= len(sections[index])
+            remaining -= 1
+        
+        return "\n\n".join(sections)
+        
+    def generate_summary(self, content: str, contact_info: dict, on_chunk=None) -> str:
+        """Generate AI summary with improved prompting.
+        
+        The response is streamed; each piece of text is passed to on_chunk as it
+        arrives and the full summary is returned at the end.
         """
+        global model
+        if not content.strip() or not GEMINI_API_KEY:
+            return NO_SUMMARY_MESSAGE
+        
+        # Trimming can leave nothing but section headers; don't pay for a filler reply
+        trimmed = self.trim_prompt_content(content)
+        headers = (WEBSITE_SECTION_HEADER, NEWS_SECTION_HEADER)
+        if not any(line.strip() and line not in headers for line in trimmed.splitlines()):
+            return NO_SUMMARY_MESSAGE
+        
+        prompt = PROMPT_TEMPLATE.format(
+            name=contact_info['name'],
+            company=contact_info['company'],
+            content=trimmed
+        )
         
         try:
-            response = model.generate_content(prompt)
-            return response.text
+            if model is None:
+                genai.configure(api_key=GEMINI_API_KEY)
+                model = genai.GenerativeModel(GEMINI_MODEL_NAME)
+            
+            response = model.generate_content(prompt, stream=True)
+            chunks = []
+            for chunk in response:
+                chunks.append(chunk.text)
+                if on_chunk is not None:
+                    on_chunk(chunk.text)
+            return "".join(chunks)
         except Exception as e:
-            return f"Summary generation failed: {str(e)}. Manual notes: Company website and news content were collected for {contact_info['name']} at {contact_info['company']}."
+            return SUMMARY_FAILED_TEMPLATE.format(
+                error=str(e), name=contact_info['name'], company=contact_info['company']
+            )
 
 def main():
     """Main function to run the GUI application."""
@@ -675,7 +1136,11 @@ def main():
     # Handle window closing
     def on_closing():
         if messagebox.askokcancel("Quit", "Do you want to quit?"):
-            root.destroy()
+            try:
+                app.shutdown_research()
+            finally:
+                app.db.close()
+                root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
     root.mainloop()
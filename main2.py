@@ -1,10 +1,22 @@
+import atexit
+import codecs
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None  # Fall back to BeautifulSoup
 import google.generativeai as genai
-import json
+import hashlib
+import mmap
+import orjson
 import os
 import re
-from urllib.parse import urlparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, urlsplit
 
 # Configure Gemini API
 from config import GEMINI_API_KEY, NEWS_API_KEY
@@ -12,9 +24,39 @@ genai.configure(api_key=GEMINI_API_KEY)
 model = genai.GenerativeModel('gemini-1.5-flash')
 
 # Constants
-MEMORY_FILE = "networking_memory.json"
+MEMORY_FILE = "networking_memory.jsonl"  # One contact per line
+LEGACY_MEMORY_FILE = "networking_memory.json"  # Migrated into MEMORY_FILE on first load
 MAX_CONTENT_LENGTH = 5000
+MAX_NEWS_DESCRIPTION_LENGTH = 300
+MAX_PROMPT_CONTENT_LENGTH = 8000  # Website text plus news sent to Gemini
+MAX_RESPONSE_BYTES = 512 * 1024  # Far more HTML than MAX_CONTENT_LENGTH of text needs
 REQUEST_TIMEOUT = 10
+HTTP_CACHE_FILE = ".http_cache.json"  # ETag / Last-Modified and extracted text per website
+SUMMARY_CACHE_DIR = ".summary_cache"  # Gemini replies keyed by SHA-256 of the prompt
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Keep-alive session shared by news and website requests
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': USER_AGENT})
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                       max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]))
+_SESSION.mount('https://', _adapter)
+_SESSION.mount('http://', _adapter)
+atexit.register(_SESSION.close)
+
+_WS_RE = re.compile(r'\s+')
+_HEADER_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.I)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.I)
+
+# URL -> [etag, last_modified, extracted content], loaded on first scrape
+_HTTP_CACHE = None
+_HTTP_CACHE_LOCK = threading.Lock()  # Bulk add scrapes from several threads
+
+# Parsed memory file, reused until save_memory writes a new one
+_MEMORY_CACHE = None
+
+# Only the tags scrape_website reads are built into the parse tree
+TAGS_OF_INTEREST = SoupStrainer(['h1', 'h2', 'h3', 'p', 'main', 'article', 'section'])
 
 def is_valid_url(url: str) -> bool:
     """Validate if a URL is properly formatted and safe."""
@@ -24,14 +66,35 @@ def is_valid_url(url: str) -> bool:
     except Exception:
         return False
 
+def normalize_url(url: str) -> str:
+    """Drop in-page fragments and exact duplicate query pairs so equivalent links compare equal."""
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:  # e.g. a malformed IPv6 host; keep the link as it was
+        return url
+    
+    normalized = url
+    # '#/...' and '#!...' are hash-routed pages, not positions within one page
+    if parts.fragment and not parts.fragment.startswith(('/', '!')):
+        normalized = normalized[:-(len(parts.fragment) + 1)]
+    
+    # Rebuild the query only when it repeats a pair, keeping its original encoding
+    pairs = parts.query.split('&')
+    unique_pairs = list(dict.fromkeys(pairs))
+    if len(unique_pairs) < len(pairs):
+        normalized = normalized.replace('?' + parts.query, '?' + '&'.join(unique_pairs), 1)
+    return normalized
+
 def sanitize_input(text: str) -> str:
     """Basic input sanitization."""
     return text.strip()[:500] if text else ""
 
-def fetch_news(api_key: str, query: str, num_articles: int = 5) -> list:
-    """Fetch news articles from NewsAPI with improved error handling."""
+def fetch_news(api_key: str, query: str, num_articles: int = 5, label: str = "") -> list:
+    """Fetch news articles from NewsAPI; label prefixes progress output for bulk runs."""
+    prefix = f"[{label}] " if label else ""
     if not query.strip():
-        print("⚠️ No industry keyword provided for news search.")
+        print(f"⚠️ {prefix}No industry keyword provided for news search.")
         return []
     
     base_url = "https://newsapi.org/v2/everything"
@@ -44,51 +107,89 @@ def fetch_news(api_key: str, query: str, num_articles: int = 5) -> list:
     }
 
     try:
-        print("📰 Fetching latest industry news...")
-        response = requests.get(base_url, params=params, timeout=REQUEST_TIMEOUT)
+        print(f"📰 {prefix}Fetching latest industry news...")
+        response = _SESSION.get(base_url, params=params, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         data = response.json()
         
         if data.get("status") != "ok":
-            print(f"⚠️ News API error: {data.get('message', 'Unknown error')}")
+            print(f"⚠️ {prefix}News API error: {data.get('message', 'Unknown error')}")
             return []
             
         articles = data.get("articles", [])
         if not isinstance(articles, list):
-            print("⚠️ Unexpected news API response format.")
+            print(f"⚠️ {prefix}Unexpected news API response format.")
             return []
             
-        print(f"✅ Found {len(articles)} recent articles")
+        print(f"✅ {prefix}Found {len(articles)} recent articles")
         return articles
         
     except requests.exceptions.Timeout:
-        print("⚠️ News request timed out. Continuing without news...")
+        print(f"⚠️ {prefix}News request timed out. Continuing without news...")
         return []
     except requests.exceptions.RequestException as e:
-        print(f"⚠️ Error fetching news: {e}")
+        print(f"⚠️ {prefix}Error fetching news: {e}")
         return []
 
-def scrape_website(url: str) -> str:
-    """Scrape website content with improved extraction and error handling."""
-    if not is_valid_url(url):
-        raise ValueError("Invalid URL provided")
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
+def _decode_html(html: bytes, content_type: str) -> str:
+    """Decode page bytes using the declared charset, a sniffed one, or UTF-8."""
+    header_match = _HEADER_CHARSET_RE.search(content_type)
+    meta_match = _META_CHARSET_RE.search(html[:4096])
+    candidates = [header_match.group(1) if header_match else None,
+                  meta_match.group(1).decode('ascii') if meta_match else None]
+    for encoding in filter(None, candidates):
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            continue
+        return html.decode(encoding, 'replace')
     
     try:
-        print("🔍 Scraping website content...")
-        response = requests.get(url, timeout=REQUEST_TIMEOUT, headers=headers)
-        response.raise_for_status()
-    except requests.exceptions.Timeout:
-        raise RuntimeError("Website request timed out")
-    except requests.exceptions.RequestException as e:
-        raise RuntimeError(f"Error fetching website: {e}")
+        return html.decode('utf-8')
+    except UnicodeDecodeError as e:
+        # MAX_RESPONSE_BYTES may have split the final character; that is still UTF-8
+        if e.start >= len(html) - 3:
+            return html.decode('utf-8', 'replace')
+    detector = requests.compat.chardet
+    guessed = detector.detect(html).get('encoding') if detector else None
+    try:
+        return html.decode(guessed or 'utf-8', 'replace')
+    except LookupError:
+        return html.decode('utf-8', 'replace')
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+def _extract_with_lexbor(html: str) -> list:
+    """Collect heading, paragraph and main-content text with selectolax's lexbor parser."""
+    tree = LexborHTMLParser(html)
     
     # Remove script and style elements
+    for node in tree.css('script, style'):
+        node.decompose()
+    
+    content_elements = []
+    
+    # Get headings for structure
+    content_elements.extend(text for text in (node.text().strip() for node in tree.css('h1, h2, h3')) if text)
+    
+    # Get paragraph content
+    content_elements.extend(text for text in (node.text().strip() for node in tree.css('p')) if text)
+    
+    # Get main content areas
+    for node in tree.css('main, article, section'):
+        text = node.text().strip()
+        if text and len(text) > 50:  # Only substantial content
+            content_elements.append(text)
+    
+    return content_elements
+
+def _extract_with_bs4(html: bytes) -> list:
+    """Collect heading, paragraph and main-content text with BeautifulSoup."""
+    # Bytes let lxml detect the page encoding itself; html.parser if lxml is missing
+    try:
+        soup = BeautifulSoup(html, 'lxml', parse_only=TAGS_OF_INTEREST)
+    except FeatureNotFound:
+        soup = BeautifulSoup(html, 'html.parser', parse_only=TAGS_OF_INTEREST)
+    
+    # Remove script and style elements nested inside the kept tags
     for script in soup(["script", "style"]):
         script.decompose()
     
@@ -97,11 +198,11 @@ def scrape_website(url: str) -> str:
     
     # Get headings for structure
     headings = soup.find_all(['h1', 'h2', 'h3'])
-    content_elements.extend([h.get_text().strip() for h in headings if h.get_text().strip()])
+    content_elements.extend(text for text in (h.get_text().strip() for h in headings) if text)
     
     # Get paragraph content
     paragraphs = soup.find_all('p')
-    content_elements.extend([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
+    content_elements.extend(text for text in (p.get_text().strip() for p in paragraphs) if text)
     
     # Get main content areas
     main_content = soup.find_all(['main', 'article', 'section'])
@@ -110,34 +211,192 @@ def scrape_website(url: str) -> str:
         if text and len(text) > 50:  # Only substantial content
             content_elements.append(text)
     
+    return content_elements
+
+def load_http_cache() -> dict:
+    """Load the conditional-GET cache from disk once per run."""
+    global _HTTP_CACHE
+    if _HTTP_CACHE is None:
+        try:
+            with open(HTTP_CACHE_FILE, "rb") as file:
+                cache = orjson.loads(file.read())
+            # Keep only well-formed [etag, last_modified, content] entries; anything
+            # else (hand edits, truncation, older formats) is treated as a miss
+            _HTTP_CACHE = {
+                url: entry for url, entry in cache.items()
+                if isinstance(entry, list) and len(entry) == 3
+                and all(value is None or isinstance(value, str) for value in entry[:2])
+                and isinstance(entry[2], str)
+            } if isinstance(cache, dict) else {}
+        except FileNotFoundError:
+            _HTTP_CACHE = {}
+        except (orjson.JSONDecodeError, IOError) as e:
+            print(f"⚠️ Error loading HTTP cache: {e}")
+            _HTTP_CACHE = {}
+    return _HTTP_CACHE
+
+def save_http_cache():
+    """Write the conditional-GET cache to disk atomically."""
+    tmp_path = HTTP_CACHE_FILE + ".tmp"
+    try:
+        with open(tmp_path, "wb") as file:
+            file.write(orjson.dumps(_HTTP_CACHE))
+        os.replace(tmp_path, HTTP_CACHE_FILE)
+    except IOError as e:
+        print(f"⚠️ Error saving HTTP cache: {e}")
+
+def scrape_website(url: str, label: str = "") -> str:
+    """Scrape website content; label prefixes progress output for bulk runs."""
+    prefix = f"[{label}] " if label else ""
+    if not is_valid_url(url):
+        raise ValueError("Invalid URL provided")
+    
+    with _HTTP_CACHE_LOCK:
+        cached = load_http_cache().get(url)
+    
+    # Let the server answer 304 if the page has not changed since the last scrape
+    headers = {}
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    
+    try:
+        print(f"🔍 {prefix}Scraping website content...")
+        with _SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True) as response:
+            if response.status_code == 304 and cached:
+                print(f"✅ {prefix}Website unchanged, reusing {len(cached[2])} characters of content")
+                return cached[2]
+            response.raise_for_status()
+            content_type = response.headers.get('Content-Type', '')
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            
+            # Stop downloading once we have more HTML than we will ever use
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(64 * 1024):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= MAX_RESPONSE_BYTES:
+                    break
+    except requests.exceptions.Timeout:
+        raise RuntimeError("Website request timed out")
+    except requests.exceptions.RequestException as e:
+        raise RuntimeError(f"Error fetching website: {e}")
+
+    html = b''.join(chunks)
+    if LexborHTMLParser is not None:
+        # lexbor assumes UTF-8, so decode here instead of handing it raw bytes
+        content_elements = _extract_with_lexbor(_decode_html(html, content_type))
+    else:
+        content_elements = _extract_with_bs4(html)
+    
     content = " ".join(content_elements)
     
     # Clean up whitespace
-    content = re.sub(r'\s+', ' ', content)
+    content = _WS_RE.sub(' ', content)
+    
+    print(f"✅ {prefix}Extracted {len(content)} characters of content")
+    content = content.strip()[:MAX_CONTENT_LENGTH]
     
-    print(f"✅ Extracted {len(content)} characters of content")
-    return content.strip()[:MAX_CONTENT_LENGTH]
+    if etag or last_modified or cached:
+        with _HTTP_CACHE_LOCK:
+            if etag or last_modified:
+                load_http_cache()[url] = [etag, last_modified, content]
+            else:
+                load_http_cache().pop(url, None)  # Validators are gone; drop the stale entry
+            save_http_cache()
+    return content
+
+def load_legacy_memory() -> list:
+    """Load contacts from the old single-array JSON memory file."""
+    try:
+        with open(LEGACY_MEMORY_FILE, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size == 0:  # mmap cannot map an empty file
+                return []
+            
+            # Map the file and let orjson parse the mapping without copying it
+            with mmap.mmap(file.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    memory = orjson.loads(view)
+            return memory if isinstance(memory, list) else []
+    except (orjson.JSONDecodeError, IOError) as e:
+        print(f"⚠️ Error loading legacy memory file: {e}")
+        return []
 
 def load_memory() -> list:
-    """Load networking memory from JSON file."""
+    """Load networking memory from JSONL file."""
+    global _MEMORY_CACHE
+    if _MEMORY_CACHE is not None:
+        return _MEMORY_CACHE
     if not os.path.exists(MEMORY_FILE):
+        # The legacy file is left in place, untouched; see the README on GUI/CLI storage
+        if os.path.exists(LEGACY_MEMORY_FILE):
+            legacy = load_legacy_memory()
+            if legacy and save_memory(legacy):
+                print(f"📦 Migrated {len(legacy)} contacts to {MEMORY_FILE}")
+                return _MEMORY_CACHE
         return []
     
     try:
-        with open(MEMORY_FILE, "r", encoding='utf-8') as file:
-            memory = json.load(file)
-            return memory if isinstance(memory, list) else []
-    except (json.JSONDecodeError, IOError) as e:
+        memory = []
+        with open(MEMORY_FILE, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size == 0:  # mmap cannot map an empty file
+                return []
+            
+            with mmap.mmap(file.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+                for line_num, line in enumerate(iter(mapped.readline, b""), 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        memory.append(orjson.loads(line))
+                    except orjson.JSONDecodeError:
+                        # Most likely a half-written append; keep the rest of the file
+                        print(f"⚠️ Skipping unreadable line {line_num} in memory file")
+        _MEMORY_CACHE = memory
+        return memory
+    except IOError as e:
         print(f"⚠️ Error loading memory file: {e}")
         return []
 
 def save_memory(memory_data: list) -> bool:
-    """Save networking memory to JSON file."""
+    """Rewrite the JSONL memory file atomically."""
+    global _MEMORY_CACHE
+    tmp_path = MEMORY_FILE + ".tmp"
     try:
-        with open(MEMORY_FILE, "w", encoding='utf-8') as file:
-            json.dump(memory_data, file, indent=2, ensure_ascii=False)
+        with open(tmp_path, "wb") as file:
+            file.writelines(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE) for entry in memory_data)
+        os.replace(tmp_path, MEMORY_FILE)  # Readers never see a half-written file
+        _MEMORY_CACHE = memory_data
         return True
     except IOError as e:
+        _MEMORY_CACHE = None  # Callers edit the cached list in place; reload from disk next time
+        print(f"❌ Error saving memory: {e}")
+        return False
+
+def append_memory(entry: dict) -> bool:
+    """Append one contact to the JSONL memory file without rewriting it."""
+    global _MEMORY_CACHE
+    try:
+        line = orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+        with open(MEMORY_FILE, "a+b") as file:
+            # An interrupted append leaves no trailing newline; start a fresh line
+            # so this entry is not glued onto the unreadable fragment
+            if file.seek(0, os.SEEK_END) > 0:
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b"\n":
+                    line = b"\n" + line
+            file.write(line)
+        if _MEMORY_CACHE is not None:
+            _MEMORY_CACHE.append(entry)
+        return True
+    except IOError as e:
+        _MEMORY_CACHE = None
         print(f"❌ Error saving memory: {e}")
         return False
 
@@ -233,11 +492,11 @@ def save_to_memory(name: str, role: str, linkedin: str, company: str, website: s
         "created_date": __import__('datetime').datetime.now().isoformat()
     }
 
-    memory_data = load_memory()
-    memory_data.append(new_entry)
+    # Loading first migrates any legacy file before the append creates MEMORY_FILE
+    load_memory()
 
-    if save_memory(memory_data):
-        print(f"\n🧠 Contact saved successfully! You now have {len(memory_data)} contacts in your network.")
+    if append_memory(new_entry):
+        print(f"\n🧠 Contact saved successfully! You now have {len(load_memory())} contacts in your network.")
         return True
     else:
         print("❌ Failed to save contact.")
@@ -288,6 +547,34 @@ def get_user_input() -> dict:
         'industry': industry
     }
 
+def _summary_cache_path(prompt: str) -> str:
+    """Return the cache file used for a prompt's summary."""
+    key = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+    return os.path.join(SUMMARY_CACHE_DIR, f"{key}.txt")
+
+def read_cached_summary(prompt: str):
+    """Return a previously generated summary for this exact prompt, or None."""
+    try:
+        with open(_summary_cache_path(prompt), "r", encoding='utf-8') as file:
+            return file.read()
+    except (FileNotFoundError, UnicodeDecodeError):
+        return None
+    except IOError as e:
+        print(f"⚠️ Error reading summary cache: {e}")
+        return None
+
+def write_cached_summary(prompt: str, summary: str):
+    """Store a generated summary under its prompt's hash."""
+    path = _summary_cache_path(prompt)
+    tmp_path = path + ".tmp"
+    try:
+        os.makedirs(SUMMARY_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w", encoding='utf-8') as file:
+            file.write(summary)
+        os.replace(tmp_path, path)
+    except IOError as e:
+        print(f"⚠️ Error writing summary cache: {e}")
+
 def generate_summary(content: str, contact_info: dict) -> str:
     """Generate AI summary with improved prompting."""
     if not content.strip():
@@ -309,62 +596,161 @@ def generate_summary(content: str, contact_info: dict) -> str:
     Please provide a structured summary that will help prepare for a networking conversation.
     """
     
+    cached = read_cached_summary(prompt)
+    if cached is not None:
+        print("♻️ Reusing networking brief generated earlier for the same content")
+        return cached
+    
     try:
         print("🤖 Generating AI-powered networking brief...")
         response = model.generate_content(prompt)
+        write_cached_summary(prompt, response.text)
         return response.text
     except Exception as e:
         print(f"⚠️ Error generating AI summary: {e}")
         return f"Summary generation failed. Manual notes: Company website and news content were collected for {contact_info['name']} at {contact_info['company']}."
 
-def add_new_contact():
-    """Add a new contact with full research pipeline."""
-    print("🚀 Let's research your networking contact!")
+def generate_batch_summaries(contents: list, contact_infos: list) -> list:
+    """Generate briefs for several contacts with a single Gemini request."""
+    summaries = ["No content available for summary."] * len(contact_infos)
+    pending = [i for i, content in enumerate(contents) if content.strip()]
+    if not pending:
+        return summaries
+    if len(pending) == 1:
+        summaries[pending[0]] = generate_summary(contents[pending[0]], contact_infos[pending[0]])
+        return summaries
+    
+    sections = "\n\n".join(
+        f"### Contact {i}: {contact_infos[i]['name']} from {contact_infos[i]['company']}\n{contents[i]}"
+        for i in pending
+    )
+    prompt = f"""
+    You are a networking assistant. For each contact below, analyze the information and create a concise networking brief.
+
+    Each brief should focus on:
+    1. Key information about the person and their role
+    2. Company overview and recent developments
+    3. Industry trends and opportunities
+    4. Potential conversation starters
+    5. Ways to add value to this connection
+
+    {sections}
+
+    Respond with a JSON array containing one object per contact, each with an integer "contact" field (the contact number above) and a string "summary" field holding that contact's brief.
+    """
     
-    # Get user input
-    contact_info = get_user_input()
+    try:
+        print(f"🤖 Generating AI-powered networking briefs for {len(pending)} contacts...")
+        response = model.generate_content(
+            prompt,
+            generation_config=genai.GenerationConfig(response_mime_type='application/json')
+        )
+        for item in orjson.loads(response.text):
+            index = item.get('contact') if isinstance(item, dict) else None
+            # bool is an int subclass, so True would otherwise pass as contact 1
+            if type(index) is int and index in pending and isinstance(item.get('summary'), str):
+                summaries[index] = item['summary']
+                pending.remove(index)
+    except Exception as e:
+        print(f"⚠️ Error generating batched AI summaries: {e}")
     
-    # Collect content for analysis
+    # Anything the batched reply missed gets its own request
+    for i in pending:
+        summaries[i] = generate_summary(contents[i], contact_infos[i])
+    return summaries
+
+def research_contact(contact_info: dict) -> tuple:
+    """Scrape the website and fetch news concurrently; return (content, news links)."""
+    name = contact_info['name']
     all_content = []
     news_links = []
     
+    # Both lookups are network-bound and independent, so overlap them
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        website_future = None
+        news_future = None
+        if contact_info['website']:
+            website_future = executor.submit(scrape_website, contact_info['website'], label=name)
+        if contact_info['industry']:
+            news_future = executor.submit(fetch_news, NEWS_API_KEY, contact_info['industry'], label=name)
+    
     # Scrape website if provided
-    if contact_info['website']:
+    if website_future is not None:
         try:
-            website_content = scrape_website(contact_info['website'])
+            website_content = website_future.result()
             if website_content:
                 all_content.append(f"Company Website Content:\n{website_content}")
         except Exception as e:
-            print(f"⚠️ Website scraping failed: {e}")
+            print(f"⚠️ [{name}] Website scraping failed: {e}")
     
     # Fetch news if industry provided
-    if contact_info['industry']:
+    if news_future is not None:
         try:
-            news_articles = fetch_news(NEWS_API_KEY, contact_info['industry'])
+            news_articles = news_future.result()
             if news_articles:
-                news_content = []
-                for article in news_articles:
-                    title = article.get('title', '')
-                    description = article.get('description', '')
-                    url = article.get('url', '')
-                    
-                    if title or description:
-                        news_content.append(f"• {title}: {description}")
-                        if url:
-                            news_links.append(url)
+                # One pass to pull the fields, keeping only articles with something to say
+                rows = [(article.get('title') or '',
+                         (article.get('description') or '')[:MAX_NEWS_DESCRIPTION_LENGTH],
+                         article.get('url') or '')
+                        for article in news_articles]
+                rows = [row for row in rows if row[0] or row[1]]
+                news_content = [f"• {title}: {description}" for title, description, _ in rows]
+                news_links = [url for _, _, url in rows if url]
                 
                 if news_content:
                     all_content.append(f"Recent Industry News:\n" + "\n".join(news_content))
         except Exception as e:
-            print(f"⚠️ News fetching failed: {e}")
+            print(f"⚠️ [{name}] News fetching failed: {e}")
+    
+    # Syndicated articles often share a URL; store each link once
+    news_links = list(dict.fromkeys(normalize_url(url) for url in news_links))
+    
+    combined_content = "\n\n".join(all_content)[:MAX_PROMPT_CONTENT_LENGTH] if all_content else ""
+    return combined_content, news_links
+
+def add_new_contact():
+    """Add a new contact with full research pipeline."""
+    print("🚀 Let's research your networking contact!")
     
-    # Generate summary
-    combined_content = "\n\n".join(all_content) if all_content else ""
+    # Get user input
+    contact_info = get_user_input()
+    
+    # Research website and news, then generate summary
+    combined_content, news_links = research_contact(contact_info)
     summary = generate_summary(combined_content, contact_info)
     
-    # Display results
+    show_and_save_contact(contact_info, summary, news_links)
+
+def add_contacts_batch(contact_infos: list):
+    """Research several contacts concurrently and summarize them in one request."""
+    if not contact_infos:
+        return
+    
+    print(f"🚀 Researching {len(contact_infos)} contacts at once...")
+    with ThreadPoolExecutor(max_workers=min(8, len(contact_infos))) as executor:
+        results = list(executor.map(research_contact, contact_infos))
+    
+    summaries = generate_batch_summaries([content for content, _ in results], contact_infos)
+    
+    for contact_info, (_, news_links), summary in zip(contact_infos, results, summaries):
+        show_and_save_contact(contact_info, summary, news_links)
+
+def bulk_add_contacts():
+    """Collect several contacts, then research them together."""
+    print("🚀 Let's research a batch of networking contacts!")
+    
+    contact_infos = []
+    while True:
+        contact_infos.append(get_user_input())
+        if input("\nAdd another contact to this batch? (y/n): ").strip().lower() != 'y':
+            break
+    
+    add_contacts_batch(contact_infos)
+
+def show_and_save_contact(contact_info: dict, summary: str, news_links: list):
+    """Display a contact's networking brief and save it to memory."""
     print("\n" + "="*60)
-    print("📋 NETWORKING BRIEF")
+    print(f"📋 NETWORKING BRIEF: {contact_info['name']}")
     print("="*60)
     print(summary)
     
@@ -393,7 +779,8 @@ def display_menu():
     print("1. 👥 View past contacts")
     print("2. 🗑️  Delete a contact") 
     print("3. ➕ Add new contact")
-    print("4. 🚪 Exit")
+    print("4. 📥 Bulk add contacts")
+    print("5. 🚪 Exit")
     print("="*60)
 
 def main():
@@ -404,7 +791,7 @@ def main():
     while True:
         display_menu()
         
-        choice = input("Enter your choice (1-4): ").strip()
+        choice = input("Enter your choice (1-5): ").strip()
         
         if choice == "1":
             view_past_memories()
@@ -413,13 +800,15 @@ def main():
         elif choice == "3":
             add_new_contact()
         elif choice == "4":
+            bulk_add_contacts()
+        elif choice == "5":
             print("\n👋 Thanks for using Networking Assistant! Keep building those connections!")
             break
         else:
-            print("❌ Invalid choice. Please enter 1, 2, 3, or 4.")
+            print("❌ Invalid choice. Please enter 1, 2, 3, 4, or 5.")
         
         # Ask if user wants to continue
-        if choice in ["1", "2", "3"]:
+        if choice in ["1", "2", "3", "4"]:
             continue_choice = input("\nWould you like to perform another action? (y/n): ").strip().lower()
             if continue_choice != 'y':
                 print("\n👋 Thanks for using Networking Assistant! Keep building those connections!")